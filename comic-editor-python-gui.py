@@ -1,17 +1,32 @@
 import os
 import sys 
+import io
 import zipfile
+import struct
+import zlib
 import shutil
 import tempfile
-import xml.etree.ElementTree as ET
+import queue
+import concurrent.futures
+import weakref
 from pathlib import Path
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import re 
 import time
 import datetime 
 import json 
+from xml.sax.saxutils import escape as xml_escape
+
+try:
+    # lxml's C parser is considerably faster for bulk runs; stdlib is the fallback
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
 try:
     import rarfile
@@ -30,34 +45,73 @@ except ImportError:
 
 class ToolTip:
     """Creates a tooltip for a given widget."""
+    # A single hidden window is shared by all tooltips; hovering only relabels, moves and shows it
+    _tip_window = None
+    _tip_label = None
+
+    # Tooltip text per widget. One <Enter>/<Leave> pair on the 'all' bind tag serves every
+    # registered widget instead of two Tcl bindings per widget
+    _texts = weakref.WeakKeyDictionary()
+    _events_bound = False
+
     def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
-        self.tip_window = None
-        self.widget.bind("<Enter>", self.show_tip)
-        self.widget.bind("<Leave>", self.hide_tip)
+        ToolTip._texts[widget] = text
+        if not ToolTip._events_bound:
+            widget.bind_all("<Enter>", ToolTip._on_enter, add='+')
+            widget.bind_all("<Leave>", ToolTip._on_leave, add='+')
+            ToolTip._events_bound = True
     
-    def show_tip(self, event=None):
-        if self.tip_window or not self.text:
-            return
-        
+    @classmethod
+    def _text_for(cls, widget) -> Optional[str]:
+        """Returns the registered tooltip text of a widget, or None."""
+        try:
+            return cls._texts.get(widget)
+        except TypeError:
+            # Widgets Tkinter has no Python object for arrive as plain path strings
+            return None
+
+    @classmethod
+    def _on_enter(cls, event):
+        text = cls._text_for(event.widget)
+        if text:
+            cls._show(event.widget, text)
+
+    @classmethod
+    def _on_leave(cls, event):
+        if cls._text_for(event.widget) is not None:
+            cls._hide()
+
+    @classmethod
+    def _get_tip_window(cls, widget):
+        """Returns the shared tooltip window, creating it (hidden) on first use."""
+        if cls._tip_window is None or not cls._tip_window.winfo_exists():
+            # Owned by the root window so it outlives any secondary window that shows a tooltip
+            cls._tip_window = tk.Toplevel(widget.nametowidget('.'))
+            cls._tip_window.wm_overrideredirect(True) 
+            cls._tip_window.withdraw()
+            
+            cls._tip_label = tk.Label(cls._tip_window, justify=tk.LEFT,
+                                      background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                      font=("tahoma", "8", "normal"))
+            cls._tip_label.pack(ipadx=1)
+        return cls._tip_window
+    
+    @classmethod
+    def _show(cls, widget, text):
         # Position the tooltip relative to the widget
-        x = self.widget.winfo_rootx() + self.widget.winfo_width()
-        y = self.widget.winfo_rooty() + self.widget.winfo_height()
+        x = widget.winfo_rootx() + widget.winfo_width()
+        y = widget.winfo_rooty() + widget.winfo_height()
         
-        self.tip_window = tk.Toplevel(self.widget)
-        self.tip_window.wm_overrideredirect(True) 
-        self.tip_window.wm_geometry(f"+{x}+{y}")
-        
-        label = tk.Label(self.tip_window, text=self.text, justify=tk.LEFT,
-                         background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                         font=("tahoma", "8", "normal"))
-        label.pack(ipadx=1)
-        
-    def hide_tip(self, event=None):
-        if self.tip_window:
-            self.tip_window.destroy()
-        self.tip_window = None
+        tip_window = cls._get_tip_window(widget)
+        cls._tip_label.config(text=text)
+        tip_window.wm_geometry(f"+{x}+{y}")
+        tip_window.deiconify()
+        tip_window.lift()
+
+    @classmethod
+    def _hide(cls):
+        if cls._tip_window is not None and cls._tip_window.winfo_exists():
+            cls._tip_window.withdraw()
 
 
 class ComicMetadataEditor:
@@ -85,7 +139,27 @@ class ComicMetadataEditor:
     
     # Reverse mapping for reading XML
     REVERSE_MAPPING = {v: k for k, v in FIELD_MAPPING.items()}
-    
+
+    XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+
+    # Common spellings of a root-level ComicInfo.xml, checked before scanning every member name
+    XML_NAME_CANDIDATES = ('ComicInfo.xml', 'comicinfo.xml', 'COMICINFO.XML')
+
+    # Fields in XML tag order (the order they are written in), sorted once at import
+    XML_FIELD_ORDER = sorted(FIELD_MAPPING.items(), key=lambda item: item[1])
+
+    # Chunk size used when streaming archive members from one file to another.
+    # Reads/writes this large bypass the 8 KiB file buffers, so each chunk is a single system call;
+    # 1 MiB per bulk-apply worker thread is a negligible amount of memory
+    COPY_CHUNK_SIZE = 1024 * 1024
+
+    # Page formats that are already compressed; deflating them again costs CPU for next to no gain
+    PRECOMPRESSED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.avif', '.jxl'})
+
+    # The XML is tiny: level 1 is much faster than the default, and its slightly larger output
+    # leaves more room for later in-place updates of the entry
+    XML_COMPRESS_LEVEL = 1
+
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
         self.is_cbz = self.file_path.suffix.lower() == '.cbz'
@@ -93,146 +167,356 @@ class ComicMetadataEditor:
         
         if not (self.is_cbz or self.is_cbr):
             raise ValueError("File must be .cbz or .cbr")
+        
+        # Set by write_metadata when the archive already held the requested metadata
+        self.unchanged = False
+        # Set by a successful write_metadata: the fields read_metadata would now return for the written file
+        self.result_metadata: Optional[Dict[str, str]] = None
+
+    @staticmethod
+    def _is_xml_name(name: str) -> bool:
+        """True for member names ending in comicinfo.xml, in any case."""
+        # Only the tail is lowercased, instead of a copy of every (possibly deeply nested) page path
+        return name[-13:].lower() == 'comicinfo.xml'
+
+    @staticmethod
+    def cbz_path_for(file_path: str) -> str:
+        """Returns the path a CBR gets converted to when its metadata is written."""
+        return str(file_path).replace('.cbr', '.cbz').replace('.CBR', '.CBZ')
+
+    def _find_xml_info(self, zf: zipfile.ZipFile) -> Optional[zipfile.ZipInfo]:
+        """Returns the ComicInfo.xml entry of an open CBZ, or None."""
+        # Most archives store it at the root under one of the usual spellings, which are plain dict lookups
+        for name in self.XML_NAME_CANDIDATES:
+            info = zf.NameToInfo.get(name)
+            if info is not None:
+                return info
+        return next((i for n, i in zf.NameToInfo.items() if self._is_xml_name(n)), None)
+
+    def _read_xml_from_zip(self, zf: zipfile.ZipFile) -> Optional[bytes]:
+        """Reads the raw ComicInfo.xml bytes from an already opened CBZ."""
+        info = self._find_xml_info(zf)
+        if info is not None:
+            return zf.read(info)
+        return None
 
-    def _read_xml_from_archive(self) -> Optional[str]:
-        """Reads ComicInfo.xml content from the archive."""
+    def _read_xml_from_rar(self, rf) -> Optional[bytes]:
+        """Reads the raw ComicInfo.xml bytes from an already opened CBR."""
+        xml_name = next((f for f in rf.namelist() if self._is_xml_name(f)), None)
+        if xml_name:
+            return rf.read(xml_name)
+        return None
+
+    def _read_xml_from_archive(self) -> Optional[bytes]:
+        """Reads the raw ComicInfo.xml bytes from the archive (the parser handles the encoding)."""
         if self.is_cbz:
             try:
                 with zipfile.ZipFile(self.file_path, 'r') as zf:
-                    xml_name = next((f for f in zf.namelist() if f.lower().endswith('comicinfo.xml')), None)
-                    if xml_name:
-                        return zf.read(xml_name).decode('utf-8')
+                    return self._read_xml_from_zip(zf)
             except Exception as e:
                 pass
         elif self.is_cbr and RARFILE_AVAILABLE:
             try:
                 with rarfile.RarFile(self.file_path, 'r') as rf:
-                    xml_name = next((f for f in rf.namelist() if f.lower().endswith('comicinfo.xml')), None)
-                    if xml_name:
-                        return rf.read(xml_name).decode('utf-8')
+                    return self._read_xml_from_rar(rf)
             except Exception as e:
                 pass
         return None
 
-    def read_metadata(self) -> Dict[str, str]:
-        """Parses ComicInfo.xml content and returns a dictionary of metadata."""
-        xml_content = self._read_xml_from_archive()
+    def _parse_xml(self, xml_content: bytes) -> Dict[str, str]:
+        """Stream-parses ComicInfo.xml content into a dictionary of metadata.
+
+        iterparse lets us clear every element as soon as it is read instead of
+        keeping a full tree around (e.g. large <Pages> blocks) only to throw it away.
+        """
         metadata = {}
-        if xml_content:
-            try:
-                # ET.fromstring handles the root attributes like 'xmlns:xsi' 
-                root = ET.fromstring(xml_content)
-                for element in root:
+        depth = 0
+        # Bound once so the per-element lookup is a plain local call
+        to_internal_key = self.REVERSE_MAPPING.get
+        try:
+            if LXML_AVAILABLE:
+                # lxml resolves entities and may fetch DTDs by default; ComicInfo.xml never needs either (XXE guard)
+                events = ET.iterparse(io.BytesIO(xml_content), events=('start', 'end'),
+                                      resolve_entities=False, no_network=True)
+            else:
+                events = ET.iterparse(io.BytesIO(xml_content), events=('start', 'end'))
+            for event, element in events:
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                # Only direct children of <ComicInfo> hold metadata (skips e.g. <Page> entries)
+                if depth == 1:
                     # Convert XML tag name (e.g., 'Title') to internal key (e.g., 'title')
                     # Strip namespace prefix if present (e.g., '{http://namespace}Tag')
-                    tag = element.tag.split('}')[-1]
-                    internal_key = self.REVERSE_MAPPING.get(tag)
-                    
+                    tag = element.tag.rpartition('}')[2]
+                    internal_key = to_internal_key(tag)
+
                     if internal_key and element.text is not None:
                         # Sanitize and store only non-empty strings
                         text_val = element.text.strip()
                         if text_val:
                             metadata[internal_key] = text_val
-            except ET.ParseError as e:
-                # print(f"XML Parse Error in {self.file_path}: {e}")
-                pass
+                element.clear()
+        except ET.ParseError as e:
+            # print(f"XML Parse Error in {self.file_path}: {e}")
+            pass
         return metadata
 
+    def read_metadata(self) -> Dict[str, str]:
+        """Parses ComicInfo.xml content and returns a dictionary of metadata."""
+        xml_content = self._read_xml_from_archive()
+        if xml_content:
+            return self._parse_xml(xml_content)
+        return {}
+
     def _create_xml(self, metadata: Dict) -> str:
         """Creates the ComicInfo XML string from a dictionary of metadata."""
-        # Filter metadata for non-empty/non-None values
-        filtered_metadata = {
-            k: v for k, v in metadata.items() 
-            if v is not None and v is not False and (str(v).strip() or str(v) == '0')
-        }
-        
-        # Add required XML schema attributes to the root element
-        root = ET.Element(
-            'ComicInfo',
-            {
-                'xmlns:xsi': "http://www.w3.org/2001/XMLSchema-instance",
-                'xsi:noNamespaceSchemaLocation': "ComicInfo.xsd"
-            }
-        )
-        root.text = '\n  '
-        root.tail = '\n'
-        
-        last_elem = None
-        
-        # Sort keys based on XML tag name for consistent XML file structure
-        sorted_keys = sorted(filtered_metadata.keys(), key=lambda k: self.FIELD_MAPPING.get(k, k))
-        
-        for key in sorted_keys:
-            value = filtered_metadata[key]
-            if key in self.FIELD_MAPPING:
-                xml_tag = self.FIELD_MAPPING[key]
-                elem = ET.SubElement(root, xml_tag)
-                elem.text = str(value)
-                elem.tail = '\n  '
-                last_elem = elem
-        
-        if last_elem is not None:
-            last_elem.tail = '\n'
-        
-        # Convert the ElementTree to a string
-        xml_str = ET.tostring(root, encoding='utf-8', short_empty_elements=True, xml_declaration=False).decode('utf-8')
-        
-        # Add XML declaration and return
-        return '<?xml version="1.0" encoding="utf-8"?>\n' + xml_str
-
-    def write_metadata(self, metadata: Dict) -> Optional[str]:
-        """Writes new ComicInfo.xml into the archive, returning the new file path if successful (for CBR->CBZ conversion)."""
-        xml_content = self._create_xml(metadata)
-        
-        temp_dir = Path(tempfile.mkdtemp())
-        temp_xml_path = temp_dir / 'ComicInfo.xml'
+        # The layout is fixed, so the XML is formatted directly instead of building and serializing an element tree
+        parts = [
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            f'<ComicInfo xmlns:xsi="{self.XSI_NAMESPACE}" xsi:noNamespaceSchemaLocation="ComicInfo.xsd">\n'
+        ]
+        for key, xml_tag in self.XML_FIELD_ORDER:
+            value = metadata.get(key)
+            # Only non-empty values are written (0 is a valid value, None/False are not)
+            if value is None or value is False:
+                continue
+            text = str(value)
+            if text.strip():
+                parts.append(f'  <{xml_tag}>{xml_escape(text)}</{xml_tag}>\n')
+        parts.append('</ComicInfo>\n')
+        return ''.join(parts)
+
+    def _copy_raw_entry(self, src, zf_out: zipfile.ZipFile, info: zipfile.ZipInfo):
+        """Splices one member (local header + compressed data) byte-for-byte into zf_out."""
+        src.seek(info.header_offset)
+        header = src.read(30)
+        if len(header) != 30 or header[:4] != b'PK\x03\x04':
+            raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        length = 30 + name_len + extra_len + info.compress_size
+
+        if info.flag_bits & 0x08:
+            # Sizes/CRC live in a data descriptor after the data: [signature] CRC, sizes (8 bytes each for ZIP64)
+            extra = src.read(name_len + extra_len)[name_len:]
+            is_zip64 = False
+            while len(extra) >= 4:
+                field_id, field_len = struct.unpack('<HH', extra[:4])
+                if field_id == 0x0001:
+                    is_zip64 = True
+                    break
+                extra = extra[4 + field_len:]
+            src.seek(info.header_offset + length)
+            has_signature = src.read(4) == b'PK\x07\x08'
+            length += (4 if has_signature else 0) + 4 + (16 if is_zip64 else 8)
+
+        src.seek(info.header_offset)
+        info.header_offset = zf_out.fp.tell()
+        remaining = length
+        while remaining:
+            chunk = src.read(min(self.COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+            zf_out.fp.write(chunk)
+            remaining -= len(chunk)
+
+        # Register the entry so zf_out writes it into the central directory on close
+        zf_out.filelist.append(info)
+        zf_out.NameToInfo[info.filename] = info
+        zf_out.start_dir = zf_out.fp.tell()
+
+    def _rewrite_cbz(self, src, zf_in: zipfile.ZipFile, target, xml_bytes: bytes):
+        """Writes a copy of the open CBZ (src/zf_in) with the given ComicInfo.xml to target (a path or binary file).
+
+        Pages are copied as their already-compressed bytes, so nothing gets inflated and
+        re-deflated; the only new data is the XML entry and the central directory.
+        """
+        with zipfile.ZipFile(target, 'w') as zf_out:
+            # The archive comment can hold ComicBookInfo JSON, so it travels with the pages
+            zf_out.comment = zf_in.comment
+            for info in zf_in.infolist():
+                # Drops every old ComicInfo.xml, including duplicates left behind by append-mode updates
+                if self._is_xml_name(info.filename):
+                    continue
+                self._copy_raw_entry(src, zf_out, info)
+            zf_out.writestr('ComicInfo.xml', xml_bytes, compress_type=zipfile.ZIP_DEFLATED,
+                            compresslevel=self.XML_COMPRESS_LEVEL)
+
+    def _try_inplace_update(self, fp, zf: zipfile.ZipFile, xml_bytes: bytes) -> bool:
+        """Overwrites the existing ComicInfo.xml entry in place if the new XML fits into its slot.
+
+        fp must be the archive opened 'r+b' and zf the ZipFile reading it. The entry keeps its exact
+        compressed size, so no other offset in the archive moves: only the XML data plus the CRC/size
+        fields of its local header and central directory record change.
+        Returns False, before anything is written, when the archive has to be rebuilt instead.
+        Not crash-safe: the patch is three separate writes to the original file, so a crash or write
+        error in between leaves ComicInfo.xml with a CRC that doesn't match its data (the pages are
+        never touched). Write errors are raised, not turned into False, as the file may be half patched.
+        """
+        try:
+            matches = [i for i in zf.infolist() if self._is_xml_name(i.filename)]
+            central_dir_offset = zf.start_dir
+
+            if len(matches) != 1:
+                return False
+            info = matches[0]
+            # Skip encrypted entries, data descriptors and ZIP64 sizes - the full rewrite handles those
+            if info.flag_bits & 0x09 or info.compress_size >= 0xFFFFFFFF or info.file_size >= 0xFFFFFFFF:
+                return False
+
+            slot_size = info.compress_size
+            if info.compress_type == zipfile.ZIP_DEFLATED:
+                # Best compression gives the most room; the XML is tiny so level 9 costs nothing
+                compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+                # A sync flush leaves the stream byte-aligned without marking the last block as final
+                data = compressor.compress(xml_bytes) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                padding = slot_size - len(data) - 5
+                if padding < 0 or padding > 0xFFFF:
+                    return False
+                # Close the stream with a final stored block of newlines (whitespace after the root element is valid XML)
+                data += struct.pack('<BHH', 1, padding, padding ^ 0xFFFF) + b'\n' * padding
+            elif info.compress_type == zipfile.ZIP_STORED:
+                padding = slot_size - len(xml_bytes)
+                if padding < 0:
+                    return False
+                data = xml_bytes + b'\n' * padding
+            else:
+                return False
+            content = xml_bytes + b'\n' * padding
+            sizes = struct.pack('<III', zlib.crc32(content), slot_size, len(content))
+
+            fp.seek(info.header_offset)
+            header = fp.read(30)
+            if header[:4] != b'PK\x03\x04':
+                return False
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            name = fp.read(name_len)
+
+            # Locate the matching central directory record (CRC and sizes start at byte 16)
+            fp.seek(central_dir_offset)
+            central_dir = fp.read()
+            record_offset = None
+            pos = 0
+            while central_dir[pos:pos + 4] == b'PK\x01\x02':
+                n, m, k = struct.unpack('<HHH', central_dir[pos + 28:pos + 34])
+                if central_dir[pos + 46:pos + 46 + n] == name:
+                    record_offset = central_dir_offset + pos
+                    break
+                pos += 46 + n + m + k
+            if record_offset is None:
+                return False
+        except (OSError, zipfile.BadZipFile, struct.error):
+            return False
+
+        # From here on the original is modified: the CRC/size fields go first, then the data
+        fp.seek(info.header_offset + 14)
+        fp.write(sizes)
+        fp.seek(record_offset + 16)
+        fp.write(sizes)
+        fp.seek(info.header_offset + 30 + name_len + extra_len)
+        fp.write(data)
+        return True
+
+    def write_metadata(self, metadata: Dict, merge: bool = False) -> Optional[str]:
+        """Writes new ComicInfo.xml into the archive, returning the new file path if successful (for CBR->CBZ conversion).
+
+        With merge=True, metadata only holds updates that are layered over the fields already in the archive.
+        """
+        temp_archive = None
+        # The flags describe this call only, also when the same editor writes more than once
+        self.unchanged = False
+        self.result_metadata = None
         
         try:
-            # 1. Write XML to a temporary file
-            with open(temp_xml_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
-            
-            # 2. Update the archive
             new_file_path = str(self.file_path) # Default to original path
             
             if self.is_cbz:
-                # CBZ (ZIP) - Safely update by copying and overwriting
-                temp_archive = temp_dir / self.file_path.name
-                shutil.copy2(self.file_path, temp_archive)
-                
-                with zipfile.ZipFile(temp_archive, 'a') as zf_temp:
-                    # Write the new/updated XML, overwriting the old one if it exists
-                    zf_temp.write(temp_xml_path, 'ComicInfo.xml')
-                
-                # Overwrite the original file with the updated temporary file
-                shutil.move(temp_archive, self.file_path)
+                # A single open serves the merge read, the in-place patch and the rebuild source
+                with open(self.file_path, 'r+b') as fp, zipfile.ZipFile(fp, 'r') as zf:
+                    existing_xml = self._read_xml_from_zip(zf)
+                    existing = self._parse_xml(existing_xml) if existing_xml else {}
+                    if merge:
+                        metadata = {**existing, **metadata}
+                    xml_content = self._create_xml(metadata)
+
+                    # Nothing to write if the archive already holds exactly these fields
+                    if existing_xml and xml_content == self._create_xml(existing):
+                        self.unchanged = True
+                        self.result_metadata = existing
+                        return new_file_path
+                    xml_bytes = xml_content.encode('utf-8')
+
+                    # Fast path: patch the existing entry without touching the rest of the archive.
+                    # Unlike the rebuild below this is not atomic; a failed patch raises instead of falling through.
+                    if not self._try_inplace_update(fp, zf, xml_bytes):
+                        # CBZ (ZIP) - Safely update by rebuilding into a temporary archive and overwriting.
+                        # It lives next to the original so the swap below is a same-filesystem rename, not a copy.
+                        with tempfile.NamedTemporaryFile(delete=False, suffix='.cbz.tmp', dir=self.file_path.parent) as tmp:
+                            temp_archive = Path(tmp.name)
+                            self._rewrite_cbz(fp, zf, tmp, xml_bytes)
+
+                if temp_archive is not None:
+                    shutil.copymode(self.file_path, temp_archive)
+
+                    # Atomically overwrite the original file with the updated temporary file.
+                    # Deliberately no fsync per archive: that would stall every file of a bulk apply,
+                    # callers flush the directories once via sync_directories() when the batch is done.
+                    os.replace(temp_archive, self.file_path)
+                    temp_archive = None
 
             elif self.is_cbr and RARFILE_AVAILABLE:
                 # CBR (RAR) - Must convert to CBZ (ZIP)
-                
-                # Create a list of files in the RAR archive to copy (excluding existing XML)
-                file_list = []
+                # The RAR is opened once for the merge read and the copy (every open re-parses its headers)
                 with rarfile.RarFile(self.file_path, 'r') as rf:
-                    for f in rf.namelist():
-                        if not f.lower().endswith('comicinfo.xml'):
-                            file_list.append(f)
+                    if merge:
+                        existing_xml = self._read_xml_from_rar(rf)
+                        existing = self._parse_xml(existing_xml) if existing_xml else {}
+                        metadata = {**existing, **metadata}
+                    xml_content = self._create_xml(metadata)
+                    
+                    # Same check as for CBZ; an unchanged CBR is left alone instead of being repacked into a CBZ
+                    if merge and existing_xml and xml_content == self._create_xml(existing):
+                        self.unchanged = True
+                        self.result_metadata = existing
+                        return new_file_path
+                    xml_bytes = xml_content.encode('utf-8')
+                    
+                    # Create a list of files in the RAR archive to copy (excluding existing XML)
+                    file_list = [i for i in rf.infolist() if not self._is_xml_name(i.filename)]
                     
                     # Create new CBZ path
-                    new_file_path = str(self.file_path).replace('.cbr', '.cbz').replace('.CBR', '.CBZ')
+                    new_file_path = self.cbz_path_for(self.file_path)
                     if os.path.exists(new_file_path):
                         os.remove(new_file_path) # Remove previous version if exists
                         
                     # Create the new CBZ archive
                     with zipfile.ZipFile(new_file_path, 'w', zipfile.ZIP_DEFLATED) as zf_new:
-                        # Add the new ComicInfo.xml
-                        zf_new.write(temp_xml_path, 'ComicInfo.xml')
+                        # Add the new ComicInfo.xml straight from memory
+                        zf_new.writestr('ComicInfo.xml', xml_bytes, compress_type=zipfile.ZIP_DEFLATED,
+                                        compresslevel=self.XML_COMPRESS_LEVEL)
                         
                         # Add all original files from RAR
-                        for f in file_list:
-                            # Extract to temp, then add to zip
-                            temp_file = rf.extract(f, temp_dir)
-                            zf_new.write(temp_file, f)
-                            os.remove(temp_file) # Clean up temp file
+                        for item in file_list:
+                            if item.is_dir():
+                                zf_new.writestr(item.filename.rstrip('/') + '/', b'')
+                                continue
+
+                            date_time = item.date_time[:6] if item.date_time else (1980, 1, 1, 0, 0, 0)
+                            zinfo = zipfile.ZipInfo(item.filename, date_time=date_time)
+                            zinfo.external_attr = 0o644 << 16
+                            # Known size up front lets zipfile decide on ZIP64 without forcing it
+                            zinfo.file_size = item.file_size
+                            # Images are stored as-is, everything else is deflated
+                            if Path(item.filename).suffix.lower() in self.PRECOMPRESSED_EXTENSIONS:
+                                zinfo.compress_type = zipfile.ZIP_STORED
+                            else:
+                                zinfo.compress_type = zipfile.ZIP_DEFLATED
+
+                            # Stream straight from the RAR into the ZIP through a bounded buffer
+                            # instead of extracting every page to a temp file first
+                            with rf.open(item) as src, zf_new.open(zinfo, 'w') as dst:
+                                shutil.copyfileobj(src, dst, self.COPY_CHUNK_SIZE)
                             
                 # Delete the old CBR file
                 os.remove(self.file_path)
@@ -240,6 +524,8 @@ class ComicMetadataEditor:
             else:
                 raise ValueError("CBR is not supported (rarfile missing)")
                 
+            # Parsing the small XML that was just written is what a later read_metadata would return
+            self.result_metadata = self._parse_xml(xml_bytes)
             return new_file_path
 
         except Exception as e:
@@ -247,9 +533,24 @@ class ComicMetadataEditor:
             return None
             
         finally:
-            # Clean up temporary directory
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            # Clean up a rebuilt archive that never replaced the original
+            if temp_archive is not None and temp_archive.exists():
+                temp_archive.unlink()
+
+    @staticmethod
+    def sync_directories(file_paths) -> None:
+        """Flushes the directories of the given files to disk, once per directory (POSIX only)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        for directory in {os.path.dirname(os.path.abspath(p)) for p in file_paths}:
+            try:
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
 
 
 class MetadataViewer:
@@ -257,12 +558,20 @@ class MetadataViewer:
     
     FIELD_MAP = ComicMetadataEditor.FIELD_MAPPING
     
+    # Value row colors (Treeview tags)
+    HOVER_BG = "#e0e0ff" # Light blue background
+    HOVER_FG = "#0000FF" # Blue text
+    CONFIRM_BG = "#ccffcc" # Light Green
+    CONFIRM_FG = "#006400" # Dark Green
+    CONFIRM_TEXT = "🚀 Copied to Clipboard! (Ctrl+C on that thang!)"
+    
     def __init__(self, master, metadata: Dict[str, str], file_path: str):
         self.master = master
         self.metadata = metadata
         self.file_path = file_path
         
-        self.string_vars = {} 
+        self.values: Dict[str, str] = {} # internal key -> full value to copy
+        self._hover_row = ""
         
         self.top = tk.Toplevel(master)
         self.top.title(f"Metadata Viewer: {os.path.basename(file_path)}")
@@ -278,36 +587,26 @@ class MetadataViewer:
         ttk.Label(main_frame, text="Current Metadata (Read-Only)", font=("Arial", 12, "bold")).pack(pady=(0, 10))
         ttk.Label(main_frame, text=f"Source: {os.path.basename(file_path)}", font=("Arial", 9, "italic")).pack(pady=(0, 5))
         
-        # --- Canvas and Scrollbar Setup (The Scrollable Area) ---
-        canvas_frame = ttk.Frame(main_frame)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        # --- Treeview and Scrollbar Setup (The Scrollable Area) ---
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
         
-        # We must use tk.Canvas for proper cross-platform scrolling within a Toplevel window
-        canvas = tk.Canvas(canvas_frame, borderwidth=0)
-        v_scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
+        # A single Treeview draws only the visible rows, so resizing doesn't re-layout a grid of label pairs
+        self.tree = ttk.Treeview(tree_frame, columns=('value',), show='tree headings', selectmode='none', height=20)
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         
         v_scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        canvas.configure(yscrollcommand=v_scrollbar.set)
-        
-        scrollable_frame = ttk.Frame(canvas, padding="5 0 5 0")
-
-        def _on_frame_configure(event):
-            # This is critical for the scrollbar to know the size of the inner frame
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        
-        scrollable_frame.bind("<Configure>", _on_frame_configure)
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        # --- End Canvas Setup ---
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.configure(yscrollcommand=v_scrollbar.set)
+        # --- End Treeview Setup ---
 
-        self.create_widgets(scrollable_frame)
+        self.create_widgets(self.tree)
         self.show_metadata()
 
         # Footer
         footer = ttk.Frame(main_frame)
         footer.pack(fill='x', pady=10)
-        ToolTip(footer, "Clicking a value copies it to your clipboard. Hovering highlights the text.")
+        ToolTip(footer, "Clicking a value copies it to your clipboard. Hovering highlights the row.")
         ttk.Label(footer, text="Click value to copy to clipboard", font=("Arial", 8, "italic"), foreground="gray").pack(side=tk.LEFT)
         ttk.Button(footer, text="Close", command=self.top.destroy).pack(side=tk.RIGHT)
 
@@ -324,21 +623,23 @@ class MetadataViewer:
         self.top.geometry(f"+{x}+{y}")
 
 
-    def create_widgets(self, parent):
-        """Creates label/value pairs for all possible fields."""
+    def create_widgets(self, tree: ttk.Treeview):
+        """Creates one row per possible field, keyed by its internal name."""
         
         ordered_keys = sorted(self.FIELD_MAP.keys(), key=lambda k: self.FIELD_MAP[k])
         
-        row_idx = 0
+        tree.heading('#0', text="Field", anchor=tk.W)
+        tree.heading('value', text="Value", anchor=tk.W)
+        tree.column('#0', width=170, stretch=False)
+        tree.column('value', width=420, stretch=True)
         
-        parent.grid_columnconfigure(0, weight=0) 
-        parent.grid_columnconfigure(1, weight=1) 
+        tree.tag_configure('hover', background=self.HOVER_BG, foreground=self.HOVER_FG)
+        tree.tag_configure('copied', background=self.CONFIRM_BG, foreground=self.CONFIRM_FG)
         
-        # Define hover colors
-        NORMAL_BG = "#ffffff"
-        HOVER_BG = "#e0e0ff" # Light blue background
-        NORMAL_FG = "#000000" # Black text
-        HOVER_FG = "#0000FF" # Blue text
+        # Click copies the row's value, hover gives background and foreground feedback
+        tree.bind("<Button-1>", lambda e: self._copy_to_clipboard(tree.identify_row(e.y)))
+        tree.bind("<Motion>", lambda e: self._set_hover(tree.identify_row(e.y)))
+        tree.bind("<Leave>", lambda e: self._set_hover(""))
         
         for internal_key in ordered_keys:
             # Skip keys that are usually calculated
@@ -346,71 +647,48 @@ class MetadataViewer:
                 continue 
 
             xml_tag = self.FIELD_MAP.get(internal_key, internal_key)
-
-            ttk.Label(parent, text=f"{xml_tag}:", font=("Arial", 9, "bold")).grid(row=row_idx, column=0, sticky=tk.W, padx=5, pady=2)
-            
-            var = tk.StringVar(parent)
-            self.string_vars[internal_key] = var 
-
-            value_label = ttk.Label(parent, textvariable=var, wraplength=400, justify=tk.LEFT, 
-                                    background=NORMAL_BG, foreground=NORMAL_FG, 
-                                    relief=tk.FLAT, anchor=tk.NW)
-            value_label.grid(row=row_idx, column=1, sticky=tk.W + tk.E + tk.N + tk.S, padx=5, pady=2, ipadx=5, ipady=2)
-            
-            # --- BINDING: Pass the StringVar and the Label widget ---
-            def _copy_bind(var_ref, label_ref):
-                # The lambda function captures the current references
-                return lambda e: self._copy_to_clipboard(var_ref, label_ref)
-
-            value_label.bind("<Button-1>", _copy_bind(var, value_label))
-            # ----------------------------------------------------------------
-
-            # Hover feedback (background and foreground change)
-            value_label.bind("<Enter>", lambda e, l=value_label: l.config(background=HOVER_BG, foreground=HOVER_FG))
-            value_label.bind("<Leave>", lambda e, l=value_label: l.config(background=NORMAL_BG, foreground=NORMAL_FG))
-            
-            parent.grid_rowconfigure(row_idx, weight=1) 
-            
-            row_idx += 1
+            tree.insert('', 'end', iid=internal_key, text=f"{xml_tag}:")
 
     def show_metadata(self):
-        """Populates the StringVars with the actual metadata values."""
-        
-        for key in self.string_vars:
-            self.string_vars[key].set("(Not Set)")
-        
-        for key, value in self.metadata.items():
-            if key in self.string_vars:
-                display_value = str(value).strip() if value else "(Not Set)"
-                self.string_vars[key].set(display_value)
-
-    def _copy_to_clipboard(self, var: tk.StringVar, label_widget: ttk.Label):
-        """Copies the given text to the clipboard and shows visual confirmation."""
-        text = var.get()
-        if text and text != "(Not Set)":
+        """Fills the value column with the actual metadata values."""
+        
+        for key in self.tree.get_children():
+            value = self.metadata.get(key)
+            display_value = str(value).strip() if value else ""
+            self.values[key] = display_value
+            # Rows are single-line, so multi-line values (e.g. Summary) are flattened for display only
+            self.tree.set(key, 'value', " ".join(display_value.split()) or "(Not Set)")
+
+    def _set_hover(self, row: str):
+        """Moves the hover highlight to the given row ('' clears it)."""
+        if row == self._hover_row:
+            return
+        if self._hover_row and self.tree.exists(self._hover_row) and self.tree.tag_has('hover', self._hover_row):
+            self.tree.item(self._hover_row, tags=())
+        self._hover_row = row
+        if row and not self.tree.tag_has('copied', row):
+            self.tree.item(row, tags=('hover',))
+
+    def _copy_to_clipboard(self, row: str):
+        """Copies the value of the given row to the clipboard and shows visual confirmation."""
+        text = self.values.get(row)
+        if text:
             self.top.clipboard_clear()
             self.top.clipboard_append(text)
             self.top.update() 
 
             # --- Visual Confirmation ---
-            original_display_text = text # Store original text for revert
+            original_display_text = self.tree.set(row, 'value') # Store displayed text for revert
             
-            # Use the existing StringVar for the text, so the label updates automatically
-            CONFIRM_TEXT = "🚀 Copied to Clipboard! (Ctrl+C on that thang!)"
-            CONFIRM_FG = "#006400" # Dark Green
-            CONFIRM_BG = "#ccffcc" # Light Green
-            
-            # Temporarily change label properties
-            label_widget.config(text=CONFIRM_TEXT, foreground=CONFIRM_FG, background=CONFIRM_BG, font=("Arial", 9, "bold"))
+            # Temporarily change the row's text and colors
+            self.tree.set(row, 'value', self.CONFIRM_TEXT)
+            self.tree.item(row, tags=('copied',))
 
             def revert():
-                # Revert to original text and colors (using the standard colors from create_widgets)
-                # We check the current text to avoid reverting if the user immediately hovers away and the Enter binding resets the color
-                if label_widget.cget("text") == CONFIRM_TEXT:
-                    label_widget.config(text=original_display_text, 
-                                        foreground="#000000", 
-                                        background="#ffffff", 
-                                        font=("Arial", 9, "normal"))
+                # Revert to original text, keeping the hover color if the pointer is still on the row
+                if self.tree.winfo_exists() and self.tree.set(row, 'value') == self.CONFIRM_TEXT:
+                    self.tree.set(row, 'value', original_display_text)
+                    self.tree.item(row, tags=('hover',) if row == self._hover_row else ())
                 
             # Schedule the revert function to run after 750 milliseconds
             self.top.after(750, revert)
@@ -431,6 +709,16 @@ class ComicMetadataGUI:
         'authorsort', 'summary', 'maincharacter', 'characters', 'teams', 
         'locations', 'notes', 'review', 'scaninformation', 'web', 'country'
     ]
+    
+    # Tooltip texts of the 'apply' checkboxes, built once and shared by every row
+    APPLY_TOOLTIP = "Check this box to **APPLY** the field value below to selected files. If unchecked, the existing value will be preserved."
+    APPLY_PLACEHOLDER_TOOLTIP = APPLY_TOOLTIP + "\n\nSupports string formatting:\n- **%n%**: Sequential Number (1, 2, 3...)\n- **%c%**: Total Count"
+
+    # Boolean fields written as 'Yes'/'No' in ComicInfo.xml
+    YES_NO_FIELDS = frozenset({'seriescomplete', 'blackandwhite', 'read'})
+    
+    # Language combobox entries look like 'en (English)'; group 1 is the ISO code
+    LANGUAGE_PATTERN = re.compile(r'([a-z]{2,3})\s+\(.+\)', re.IGNORECASE)
 
 
     # --- Standard Lists for Comboboxes ---
@@ -441,6 +729,8 @@ class ComicMetadataGUI:
         'sv (Swedish)', 'fi (Finnish)', 'nb (Norwegian)', 'da (Danish)',
         'la (Latin)', 'ar (Arabic)', 'tr (Turkish)', 'he (Hebrew)'
     ]
+    # ISO code -> combobox entry ('en' -> 'en (English)')
+    ISO_LANGUAGE_LOOKUP = {s.split(' ', 1)[0]: s for s in ISO_LANGUAGES}
     
     COMMON_COUNTRIES = [
         'USA', 'UK', 'Canada', 'Australia', 'New Zealand', 'France', 'Germany', 
@@ -463,6 +753,16 @@ class ComicMetadataGUI:
     ]
     # -----------------------------------
 
+    # Worker threads used to rewrite archives during a bulk apply; the work is disk-bound,
+    # so more threads than this only add seek contention on HDDs and network shares
+    MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+    # Number of per-file errors listed in the bulk apply summary
+    MAX_REPORTED_ERRORS = 5
+
+    # Number of parsed ComicInfo.xml results kept for View/Import
+    METADATA_CACHE_SIZE = 256
+
     def __init__(self, root):
         self.root = root
         self.root.title("Comic Metadata Bulk Editor - v2.31 (Autovoluming Re-added)")
@@ -470,7 +770,20 @@ class ComicMetadataGUI:
         self.files: List[str] = []
         self.control_vars: Dict[str, tk.Variable] = {}
         self.input_widgets: Dict[str, tk.Widget] = {} 
+        # Multi-line fields have no variable, their value is read from the widget itself
+        self.text_widgets: Dict[str, scrolledtext.ScrolledText] = {}
         self.autonumber_start_var = tk.StringVar(value='1')
+        self._apply_in_progress = False # True while worker threads are rewriting archives
+        self._apply_state: Optional[dict] = None # Bookkeeping of the running bulk apply, see _poll_apply_results
+        self._select_refresh_pending = False # True while a selection-driven status refresh is scheduled
+        self._scroll_pending = False # True while collected wheel ticks wait to be applied
+        self._scroll_accum = 0 # Wheel units collected since the last applied scroll
+        # path -> ((mtime_ns, size), metadata), least recently used first
+        self._metadata_cache: OrderedDict = OrderedDict()
+        # Single-file metadata reads (view/import) run here so opening a large archive doesn't freeze the window
+        self._read_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._read_in_progress = False # True while a view/import read is running on _read_pool
+        self._toast: Optional[tk.Label] = None # Current completion notice, see _show_toast
         
         # New member variables for the new buttons
         self.copy_all_btn: Optional[ttk.Button] = None
@@ -479,8 +792,10 @@ class ComicMetadataGUI:
         self._setup_styles()
         self._setup_main_layout()
         self._create_metadata_tab() # Single, consolidated tab
+        self._bucket_field_vars()
         
-        self.show_welcome_message()
+        # Let the main window appear first; the welcome dialog is built once the event loop runs
+        self.root.after(100, self.show_welcome_message)
         
     def _setup_styles(self):
         """Configure Ttk styles."""
@@ -597,9 +912,25 @@ class ComicMetadataGUI:
         self.progress_bar = ttk.Progressbar(parent, orient="horizontal", length=100, mode="determinate")
         self.progress_bar.pack(fill=tk.X, pady=(0, 5))
         self.progress_bar.pack_forget() 
+        
+        # Only shown while a bulk apply is running
+        self.btn_cancel = ttk.Button(parent, text="Cancel Remaining Files", command=self.cancel_apply)
+        self.btn_cancel.pack(fill=tk.X, pady=(0, 5))
+        self.btn_cancel.pack_forget()
+        ToolTip(self.btn_cancel, "Stops the bulk apply after the files that are already being written. Files not started yet are left untouched.")
 
         self.update_status()
 
+    def _show_toast(self, message: str, duration_ms: int = 3000):
+        """Shows a short non-modal notice below the status bar that disappears by itself."""
+        if self._toast is not None and self._toast.winfo_exists():
+            self._toast.destroy()
+        
+        self._toast = tk.Label(self.status_bar.master, text=message, anchor=tk.W,
+                               background="#ccffcc", foreground="#006400", font=("Arial", 9, "bold"))
+        self._toast.pack(fill=tk.X, ipady=2, pady=(2, 0), after=self.status_bar)
+        self.root.after(duration_ms, self._toast.destroy)
+
     def _on_mousewheel(self, event, canvas):
         """Universal scroll wheel binding for a canvas."""
         # Windows and Linux use <MouseWheel> with a delta. macOS uses <Button-4>/<Button-5> (which appear as <MouseWheel> events with different deltas).
@@ -623,7 +954,19 @@ class ComicMetadataGUI:
             # Fallback for others
             scroll_delta = -1 if event.delta > 0 else 1
             
-        canvas.yview_scroll(scroll_delta, "units")
+        # Ticks are summed and applied at most once per frame (~16 ms), so fast/kinetic scrolling
+        # scrolls and repaints the canvas once per frame instead of once per tick
+        self._scroll_accum += scroll_delta
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.root.after(16, self._flush_scroll, canvas)
+
+    def _flush_scroll(self, canvas):
+        """Applies the wheel ticks collected by _on_mousewheel in a single scroll."""
+        self._scroll_pending = False
+        scroll_delta, self._scroll_accum = self._scroll_accum, 0
+        if scroll_delta:
+            canvas.yview_scroll(scroll_delta, "units")
 
     def _create_metadata_tab_frame(self, tab_name):
         """Helper to create a scrollable frame within a new notebook tab."""
@@ -649,14 +992,33 @@ class ComicMetadataGUI:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         
         # --- SCROLL WHEEL BINDING (Cross-Platform) ---
-        canvas.bind("<MouseWheel>", lambda e: self._on_mousewheel(e, canvas))
+        # One application-wide binding per event instead of separate binds on the canvas and the frame:
+        # it also fires over the input widgets inside, and is filtered down to this canvas' subtree.
+        canvas_path = str(canvas)
+        wheel_owners: Dict[str, bool] = {} # widget class -> has its own wheel binding
+
+        def _on_wheel(event):
+            widget_path = str(event.widget)
+            if widget_path != canvas_path and not widget_path.startswith(canvas_path + '.'):
+                return
+            # Combobox dropdowns are toplevels below the combobox path and scroll their own list
+            if '.popdown' in widget_path:
+                return
+            # Text, Combobox and other widgets with a class wheel binding handle the wheel themselves
+            widget_class = canvas.tk.call('winfo', 'class', widget_path)
+            if widget_class not in wheel_owners:
+                wheel_owners[widget_class] = any(
+                    'MouseWheel' in seq or 'Button-4' in seq or 'Button-5' in seq
+                    for seq in canvas.bind_class(widget_class)
+                )
+            if wheel_owners[widget_class]:
+                return
+            self._on_mousewheel(event, canvas)
+
+        canvas.bind_all("<MouseWheel>", _on_wheel, add='+')
         # This is for X11/macOS compatibility for scroll up/down
-        canvas.bind("<Button-4>", lambda e: self._on_mousewheel(e, canvas)) 
-        canvas.bind("<Button-5>", lambda e: self._on_mousewheel(e, canvas))
-        # Bind events to the inner frame as well, so it works when the cursor is over a widget inside
-        scrollable_frame.bind("<MouseWheel>", lambda e: self._on_mousewheel(e, canvas))
-        scrollable_frame.bind("<Button-4>", lambda e: self._on_mousewheel(e, canvas)) 
-        scrollable_frame.bind("<Button-5>", lambda e: self._on_mousewheel(e, canvas))
+        canvas.bind_all("<Button-4>", _on_wheel, add='+')
+        canvas.bind_all("<Button-5>", _on_wheel, add='+')
 
         self.scrollable_frames[tab_name] = scrollable_frame
         return scrollable_frame
@@ -674,12 +1036,8 @@ class ComicMetadataGUI:
         check_apply = ttk.Checkbutton(parent, variable=var_check)
         check_apply.grid(row=row, column=col, sticky=tk.W, padx=(5, 0), pady=2)
         
-        # Append placeholder info to tooltip for relevant fields
-        if internal_key in self.STRING_PLACEHOLDER_FIELDS:
-            extra_tip = "\n\nSupports string formatting:\n- **%n%**: Sequential Number (1, 2, 3...)\n- **%c%**: Total Count"
-            ToolTip(check_apply, f"Check this box to **APPLY** the field value below to selected files. If unchecked, the existing value will be preserved." + extra_tip)
-        else:
-            ToolTip(check_apply, f"Check this box to **APPLY** the field value below to selected files. If unchecked, the existing value will be preserved.")
+        # Placeholder fields get the tooltip variant with the formatting help
+        ToolTip(check_apply, self.APPLY_PLACEHOLDER_TOOLTIP if internal_key in self.STRING_PLACEHOLDER_FIELDS else self.APPLY_TOOLTIP)
 
 
         # --- 2. Label ---
@@ -692,7 +1050,14 @@ class ComicMetadataGUI:
         # Use a larger default width for better horizontal stretching
         WIDER_WIDTH = 60 
 
-        if widget_type == 'checkbutton':
+        # Entries are by far the most common, so they are checked first
+        if widget_type == 'entry':
+            var_value = tk.StringVar()
+            self.control_vars[internal_key] = var_value
+            widget = ttk.Entry(parent, textvariable=var_value, width=WIDER_WIDTH)
+            widget.grid(row=row, column=col + 2, sticky=tk.W + tk.E, padx=(0, 5), pady=2)
+
+        elif widget_type == 'checkbutton':
             # For boolean metadata: the value is a tk.IntVar (0 or 1)
             var_value = tk.IntVar()
             self.control_vars[internal_key] = var_value
@@ -700,12 +1065,6 @@ class ComicMetadataGUI:
             # Place the checkbutton in the value column (col + 2)
             widget = ttk.Checkbutton(parent, text="", variable=var_value) 
             widget.grid(row=row, column=col + 2, sticky=tk.W, padx=(0, 5), pady=2)
-            
-        elif widget_type == 'entry':
-            var_value = tk.StringVar()
-            self.control_vars[internal_key] = var_value
-            widget = ttk.Entry(parent, textvariable=var_value, width=WIDER_WIDTH)
-            widget.grid(row=row, column=col + 2, sticky=tk.W + tk.E, padx=(0, 5), pady=2)
 
         elif widget_type == 'combobox':
             var_value = tk.StringVar()
@@ -719,9 +1078,6 @@ class ComicMetadataGUI:
         if tooltip_text and widget:
             ToolTip(widget, tooltip_text)
 
-        # Ensure the input column (col + 2) expands horizontally to fill space
-        parent.grid_columnconfigure(col + 2, weight=1)
-
     def _create_long_text_widget(self, parent, internal_key, label_text, row, tooltip_text=""):
         """Creates the special layout for multi-line text fields (Summary, Notes, Review)."""
         
@@ -732,12 +1088,8 @@ class ComicMetadataGUI:
         check_apply = ttk.Checkbutton(parent, variable=var_check)
         check_apply.grid(row=row, column=0, sticky=tk.W, padx=(5, 0), pady=2)
         
-        # Append placeholder info to tooltip for relevant fields
-        if internal_key in self.STRING_PLACEHOLDER_FIELDS:
-            extra_tip = "\n\nSupports string formatting:\n- **%n%**: Sequential Number (1, 2, 3...)\n- **%c%**: Total Count"
-            ToolTip(check_apply, f"Check this box to **APPLY** the field value below to selected files. If unchecked, the existing value will be preserved." + extra_tip)
-        else:
-            ToolTip(check_apply, f"Check this box to **APPLY** the field value below to selected files. If unchecked, the existing value will be preserved.")
+        # Placeholder fields get the tooltip variant with the formatting help
+        ToolTip(check_apply, self.APPLY_PLACEHOLDER_TOOLTIP if internal_key in self.STRING_PLACEHOLDER_FIELDS else self.APPLY_TOOLTIP)
 
 
         # --- 2. Label (Spans two columns for better look) ---
@@ -745,32 +1097,28 @@ class ComicMetadataGUI:
         label.grid(row=row, column=1, columnspan=2, sticky=tk.W, padx=(0, 5), pady=2)
 
         # --- 3. ScrolledText Widget (Value) ---
-        var_value = tk.StringVar() 
-        self.control_vars[internal_key] = var_value
-        
         # Increase default width for better horizontal space usage
         widget = scrolledtext.ScrolledText(parent, wrap=tk.WORD, width=90, height=5, font=("Arial", 9))
-        var_value.widget_ref = widget 
         
         # Widget spans columns 0 through 6 for maximum width
         widget.grid(row=row + 1, column=0, columnspan=7, sticky=tk.W + tk.E, padx=5, pady=2) 
         
-        # Update StringVar from widget content
-        widget.bind("<FocusOut>", lambda e, w=widget, v=var_value: v.set(w.get("1.0", tk.END).strip()))
-        widget.bind("<KeyRelease>", lambda e, w=widget, v=var_value: v.set(w.get("1.0", tk.END).strip()))
-        
+        # No StringVar mirror: the text is read from the widget only when it is needed
+        self.text_widgets[internal_key] = widget
         self.input_widgets[internal_key] = widget
 
         if tooltip_text:
             ToolTip(widget, tooltip_text)
 
-        # Ensure the frame allows text widgets to expand horizontally
-        parent.grid_columnconfigure(6, weight=1)
-
     def _create_metadata_tab(self):
         """Consolidated tab for all metadata, using a dense two-column grid."""
         scrollable_frame = self._create_metadata_tab_frame("All Metadata")
         
+        # The input columns of both groups (col + 2) expand horizontally to fill space;
+        # configured once here instead of once per created row
+        scrollable_frame.grid_columnconfigure(2, weight=1)
+        scrollable_frame.grid_columnconfigure(6, weight=1)
+        
         # --- Date Fields Group (Top Left) ---
         date_fields = [
             ('year', 'Year:', 'entry', None, "Publication year (YYYY)."),
@@ -812,21 +1160,18 @@ class ComicMetadataGUI:
             ('alternateSeries', 'Alt. Series:', 'entry', None, "Name of an alternate series/volume. Use %n% for sequential number and %c% for total count."),
         ]
         
-        # 1. Date fields (Left column, starting at row 0)
-        current_row = 0
-        for i, (internal_key, label, widget_type, widget_opts, tooltip) in enumerate(date_fields):
-            self._create_metadata_widget(scrollable_frame, internal_key, label, current_row + i, 0, widget_type, widget_opts, tooltip)
-        current_row += len(date_fields) # Now at the row right after the date fields
-
-        # 2. Left fields (Left column, continuing from date fields)
-        for i, (internal_key, label, widget_type, widget_opts, tooltip) in enumerate(left_fields):
-            self._create_metadata_widget(scrollable_frame, internal_key, label, current_row + i, 0, widget_type, widget_opts, tooltip)
-        max_left_row = current_row + len(left_fields)
+        # (row, col, field) for every single-line field; all rows are assigned first and built in one loop below
+        placements = []
+        
+        # 1. Date fields, then the left fields (Left column, starting at row 0)
+        for i, field in enumerate(date_fields + left_fields):
+            placements.append((i, 0, field))
+        max_left_row = len(date_fields) + len(left_fields)
 
-        # 3. Right fields (Right column, starting at row 0)
+        # 2. Right fields (Right column, starting at row 0)
         scrollable_frame.grid_columnconfigure(3, minsize=50) # Spacer column
-        for i, (internal_key, label, widget_type, widget_opts, tooltip) in enumerate(right_fields):
-            self._create_metadata_widget(scrollable_frame, internal_key, label, i, 4, widget_type, widget_opts, tooltip)
+        for i, field in enumerate(right_fields):
+            placements.append((i, 4, field))
         max_right_row = len(right_fields)
 
 
@@ -856,7 +1201,10 @@ class ComicMetadataGUI:
         
         # Use columns 0-2 (left group) for crew/text fields
         for i, (internal_key, label, tooltip) in enumerate(simple_text_fields):
-            self._create_metadata_widget(scrollable_frame, internal_key, label, simple_text_start_row + i, 0, 'entry', None, tooltip)
+            placements.append((simple_text_start_row + i, 0, (internal_key, label, 'entry', None, tooltip)))
+        
+        for row, col, (internal_key, label, widget_type, widget_opts, tooltip) in placements:
+            self._create_metadata_widget(scrollable_frame, internal_key, label, row, col, widget_type, widget_opts, tooltip)
 
 
         # MULTILINE FIELDS (Bottom section, full width)
@@ -924,13 +1272,13 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         
         ttk.Button(frame, text="Got It! Start Editing", command=top.destroy).pack(pady=10)
         
+        # One layout pass covers both windows; the requested width is valid before the dialog is mapped
         self.root.update_idletasks() 
-        top.update_idletasks() 
         
         root_x = self.root.winfo_x()
         root_y = self.root.winfo_y()
         root_w = self.root.winfo_width()
-        top_w = top.winfo_width()
+        top_w = top.winfo_reqwidth()
         
         x = root_x + (root_w // 2) - (top_w // 2)
         y = root_y + 50 
@@ -942,34 +1290,47 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         
         if not self.files:
             msg = "Ready. Load files to begin."
-            self.btn_apply.config(state=tk.DISABLED)
+            selected_count = 0
         else:
             selected_count = len(self.file_listbox.curselection())
             msg = f"Files Loaded: {len(self.files)} | Selected: {selected_count}"
-            self.btn_apply.config(state=tk.NORMAL if selected_count > 0 else tk.DISABLED)
-            
-            # Update 'Copy All' and 'View Metadata' button state
-            is_single_selection = selected_count == 1
-            if self.copy_all_btn:
-                self.copy_all_btn.config(state=tk.NORMAL if is_single_selection else tk.DISABLED)
-            if self.view_metadata_btn:
-                 self.view_metadata_btn.config(state=tk.NORMAL if is_single_selection else tk.DISABLED)
+        
+        can_apply = selected_count > 0 and not self._apply_in_progress
+        self.btn_apply.config(state=tk.NORMAL if can_apply else tk.DISABLED)
+        
+        # Update 'Copy All' and 'View Metadata' button state
+        is_single_selection = selected_count == 1
+        if self.copy_all_btn:
+            self.copy_all_btn.config(state=tk.NORMAL if is_single_selection else tk.DISABLED)
+        if self.view_metadata_btn:
+             self.view_metadata_btn.config(state=tk.NORMAL if is_single_selection else tk.DISABLED)
 
         self.status_bar.config(text=message or msg)
 
-    def _update_listbox_display(self, selected_indices=None):
+    @staticmethod
+    def _index_runs(indices) -> List[List[int]]:
+        """Groups row indices into ascending [first, last] runs of consecutive rows."""
+        runs = []
+        for idx in sorted(indices):
+            if runs and idx == runs[-1][1] + 1:
+                runs[-1][1] = idx
+            else:
+                runs.append([idx, idx])
+        return runs
+
+    def _update_listbox_display(self):
         """Refreshes the listbox content to reflect changes in self.files."""
         current_selection = self.file_listbox.curselection()
         
         self.file_listbox.delete(0, tk.END)
-        for f in self.files:
-            self.file_listbox.insert(tk.END, os.path.basename(f))
+        # One insert call for all rows instead of one Tcl round trip (and relayout) per file
+        self.file_listbox.insert(tk.END, *(os.path.basename(f) for f in self.files))
             
-        # Restore previous selection or apply new selection
-        indices_to_select = selected_indices if selected_indices is not None else current_selection
-        for idx in indices_to_select:
+        # Restore the previous selection. Contiguous runs (the usual shift/drag selection) are selected
+        # with one call each, not one per row
+        for first, last in self._index_runs(current_selection):
             try:
-                self.file_listbox.select_set(idx)
+                self.file_listbox.select_set(first, last)
             except tk.TclError:
                 pass # Index out of range
                 
@@ -977,6 +1338,9 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
 
     def add_files(self):
         """Opens file dialog to select CBZ/CBR files."""
+        if self._apply_in_progress:
+            return
+
         file_types = [
             ("Comic Archives", "*.cbz *.cbr"),
             ("CBZ files", "*.cbz"),
@@ -990,68 +1354,72 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         )
         
         if new_files:
+            # Set lookups keep adding M files to a list of N at O(N + M) instead of O(N * M)
+            known_files = set(self.files)
             for f in new_files:
-                if f not in self.files:
+                if f not in known_files:
+                    known_files.add(f)
                     self.files.append(f)
             self._update_listbox_display()
 
     def remove_selected(self):
         """Removes selected files from the list."""
         selected_indices = self.file_listbox.curselection()
-        if not selected_indices:
+        if not selected_indices or self._apply_in_progress:
             return
 
-        # Use reversed order to correctly delete from the list
-        for index in selected_indices[::-1]:
-            del self.files[index]
+        # Rebuild the list in one pass instead of deleting (and shifting the tail) once per selected file
+        removed = set(selected_indices)
+        self.files = [f for i, f in enumerate(self.files) if i not in removed]
+        
+        # Only the removed rows are deleted from the listbox (bottom run first, so earlier indices stay valid)
+        for first, last in reversed(self._index_runs(selected_indices)):
+            self.file_listbox.delete(first, last)
             
-        self._update_listbox_display()
+        self.update_status()
         self.clear_fields()
 
     def move_selected_up(self):
         """Moves selected items up one position in the list."""
         selected_indices = list(self.file_listbox.curselection())
         
-        if not selected_indices or 0 in selected_indices:
+        if not selected_indices or selected_indices[0] == 0 or self._apply_in_progress:
             return
 
+        # Row 0 is not selected (checked above), so every selected item moves up by one.
+        # Going top-down, the row above each item is unselected or was just vacated by the previous swap,
+        # so runs of selected items move as a block without any membership checks
         for i in selected_indices:
-            # Only move if the item directly above it is NOT selected
-            if i > 0 and i - 1 not in selected_indices:
-                # Swap the elements in the underlying list
-                self.files[i], self.files[i-1] = self.files[i-1], self.files[i]
+            # Swap the elements in the underlying list
+            self.files[i], self.files[i-1] = self.files[i-1], self.files[i]
                 
-        # Calculate the new selection indices
-        new_selection = [i - 1 for i in selected_indices if i > 0]
-        # Include any selected indices that were at index 0 (they didn't move)
-        new_selection += [0 for i in selected_indices if i == 0]
+        # In the listbox, moving a run of selected rows up is moving the single row above it below it.
+        # The selected rows keep their selection, so nothing has to be re-selected
+        for first, last in self._index_runs(selected_indices):
+            self.file_listbox.delete(first - 1)
+            self.file_listbox.insert(last, os.path.basename(self.files[last]))
         
-        # Filter and sort the final selection list
-        new_selection = sorted(list(set(new_selection)))
-        
-        self._update_listbox_display(new_selection)
+        self.update_status()
 
     def move_selected_down(self):
         """Moves selected items down one position in the list."""
         selected_indices = list(self.file_listbox.curselection())
         
-        if not selected_indices or (len(self.files) - 1) in selected_indices:
+        if not selected_indices or selected_indices[-1] == len(self.files) - 1 or self._apply_in_progress:
             return
 
-        # Iterate in reverse order to ensure indices remain correct during swaps
+        # The last row is not selected (checked above), so every selected item moves down by one.
+        # Iterate in reverse order, so runs of selected items move as a block (mirror of move_selected_up)
         for i in selected_indices[::-1]:
-            # Only move if the item directly below it is NOT selected
-            if i < len(self.files) - 1 and i + 1 not in selected_indices:
-                # Swap the elements in the underlying list
-                self.files[i], self.files[i+1] = self.files[i+1], self.files[i]
+            # Swap the elements in the underlying list
+            self.files[i], self.files[i+1] = self.files[i+1], self.files[i]
 
-        # Calculate the new selection indices
-        new_selection = [i + 1 for i in selected_indices if i < len(self.files) - 1]
+        # Mirror of move_selected_up: the row below each run moves above it
+        for first, last in self._index_runs(selected_indices):
+            self.file_listbox.delete(last + 1)
+            self.file_listbox.insert(first, os.path.basename(self.files[first]))
         
-        # Filter and sort the final selection list
-        new_selection = sorted(list(set(new_selection)))
-        
-        self._update_listbox_display(new_selection)
+        self.update_status()
         
     def autonumber_selected(self):
         """
@@ -1095,24 +1463,39 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         self.update_status(f"Auto-Voluming set: Start={start_num}, Count={volume_count}. 'Volume #' and 'Total Volumes' fields are ready.")
 
 
+    def _bucket_field_vars(self):
+        """Groups the field variables by how they are cleared, so clear_fields needs no per-field type checks.
+
+        Also pairs every field with its 'apply' checkbox for get_metadata_values, so it needs no per-field lookups.
+        """
+        self._string_vars: List[tk.StringVar] = []
+        self._int_vars: List[tk.IntVar] = []
+        # (key, apply checkbox, variable, text widget) in METADATA_FIELDS order; one of the last two is None
+        self._field_entries: List[Tuple[str, tk.IntVar, Optional[tk.Variable], Optional[tk.Text]]] = []
+        for key in self.METADATA_FIELDS:
+            var = self.control_vars.get(key)
+            if isinstance(var, tk.StringVar):
+                self._string_vars.append(var)
+            elif isinstance(var, tk.IntVar):
+                self._int_vars.append(var)
+
+            # 'apply' checkboxes are cleared like boolean values
+            check_var = self.control_vars.get(f'check_{key}')
+            if check_var is not None:
+                self._int_vars.append(check_var)
+                
+                text_widget = self.text_widgets.get(key)
+                if var is not None or text_widget is not None:
+                    self._field_entries.append((key, check_var, var, text_widget))
+
     def clear_fields(self):
         """Clears all input fields and unticks all checkboxes."""
-        for key in self.METADATA_FIELDS:
-            # Clear value variable (StringVar or IntVar)
-            if key in self.control_vars:
-                var = self.control_vars[key]
-                if isinstance(var, tk.StringVar):
-                    # Handle Text widget specially
-                    if hasattr(var, 'widget_ref'):
-                        var.widget_ref.delete("1.0", tk.END)
-                    var.set("")
-                elif isinstance(var, tk.IntVar):
-                    var.set(0) # Clear boolean checkbox
-
-            # Clear 'apply' checkbox
-            check_key = f'check_{key}'
-            if check_key in self.control_vars:
-                self.control_vars[check_key].set(0)
+        for widget in self.text_widgets.values():
+            widget.delete("1.0", tk.END)
+        for var in self._string_vars:
+            var.set("")
+        for var in self._int_vars:
+            var.set(0) # Clear boolean and 'apply' checkboxes
 
         self.update_status("Fields cleared. Ready for new input.")
 
@@ -1120,30 +1503,25 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         """Retrieves current values from all input fields, casting to appropriate string format for ComicInfo.xml.
            ONLY returns fields that are ticked/checked."""
         metadata = {}
-        for key in self.METADATA_FIELDS:
+        for key, check, var, text_widget in self._field_entries:
             # Only process if the 'apply' checkbox is ticked
-            check = self.control_vars.get(f'check_{key}')
-            if not check or check.get() != 1:
-                continue
-
-            var = self.control_vars.get(key)
-            if not var:
+            if check.get() != 1:
                 continue
 
             value = None
             
-            if isinstance(var, tk.StringVar):
-                # Handle StringVar (Entry, Combobox, Text)
-                if hasattr(var, 'widget_ref'):
-                    # Retrieve the content directly from the ScrolledText widget
-                    value = var.widget_ref.get("1.0", tk.END).strip()
-                else:
-                    value = var.get().strip()
+            if text_widget is not None:
+                # Retrieve the content directly from the ScrolledText widget
+                value = text_widget.get("1.0", tk.END).strip()
+
+            elif isinstance(var, tk.StringVar):
+                # Handle StringVar (Entry, Combobox)
+                value = var.get().strip()
                 
                 # Special casing for LanguageISO: extract the code (e.g., 'en')
-                if key == 'language':
-                    # Extract ISO part from 'en (English)' format
-                    match = re.match(r'([a-z]{2,3})\s+\(.+\)', value, re.IGNORECASE)
+                if key == 'language' and '(' in value:
+                    # Extract ISO part from 'en (English)' format (a typed plain code has no '(' and is kept)
+                    match = self.LANGUAGE_PATTERN.match(value)
                     if match:
                         value = match.group(1).lower()
 
@@ -1152,7 +1530,7 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
                 raw_value = var.get()
                 
                 # Convert the internal 0/1 to the standard ComicInfo.xml string ('Yes'/'No' or 'True'/'False')
-                if key in ['seriescomplete', 'blackandwhite', 'read']: 
+                if key in self.YES_NO_FIELDS:
                     value = 'Yes' if raw_value == 1 else 'No'
                 elif key == 'isfolder':
                     # This field is usually handled internally, but included for completeness
@@ -1162,8 +1540,69 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
                 metadata[key] = value
         return metadata
         
+    @staticmethod
+    def _file_signature(file_path: str):
+        """The (mtime_ns, size) pair a cached parse of the file is valid for."""
+        stat = os.stat(file_path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _cached_metadata(self, file_path: str, signature) -> Optional[Dict[str, str]]:
+        """Returns the cached metadata of a file (not a copy) if it was parsed at this signature, else None."""
+        cached = self._metadata_cache.get(file_path)
+        if cached is None or cached[0] != signature:
+            return None
+        self._metadata_cache.move_to_end(file_path)
+        return cached[1]
+
+    def _cache_metadata(self, file_path: str, signature, metadata: Dict[str, str]):
+        """Stores a file's metadata, evicting the least recently used entry when the cache is full."""
+        self._metadata_cache[file_path] = (signature, metadata)
+        self._metadata_cache.move_to_end(file_path)
+        if len(self._metadata_cache) > self.METADATA_CACHE_SIZE:
+            self._metadata_cache.popitem(last=False)
+
+    def _read_metadata_async(self, file_path: str, on_done) -> None:
+        """Calls on_done(metadata, error) on the Tk thread with the file's metadata.
+
+        The last parse is reused while the file's mtime and size are unchanged; otherwise the archive is read on a worker thread.
+        """
+        try:
+            signature = self._file_signature(file_path)
+        except OSError as e:
+            on_done(None, e)
+            return
+        
+        cached = self._cached_metadata(file_path, signature)
+        if cached is not None:
+            on_done(dict(cached), None)
+            return
+        
+        self._read_in_progress = True
+        self.root.config(cursor="watch")
+        future = self._read_pool.submit(lambda: ComicMetadataEditor(file_path).read_metadata())
+        self.root.after(20, self._poll_metadata_read, future, file_path, signature, on_done)
+
+    def _poll_metadata_read(self, future, file_path: str, signature, on_done):
+        """Waits (on the Tk thread) for a background read, then caches and delivers its result."""
+        if not future.done():
+            self.root.after(20, self._poll_metadata_read, future, file_path, signature, on_done)
+            return
+        
+        self._read_in_progress = False
+        self.root.config(cursor="")
+        try:
+            metadata = future.result()
+        except Exception as e:
+            on_done(None, e)
+            return
+        
+        self._cache_metadata(file_path, signature, metadata)
+        on_done(dict(metadata), None)
+
     def load_metadata(self):
         """Loads metadata from the currently selected file and displays it in a viewer window."""
+        if self._read_in_progress:
+            return
         selected_indices = self.file_listbox.curselection()
         
         if len(selected_indices) != 1:
@@ -1173,9 +1612,13 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         selected_index = selected_indices[0]
         file_path = self.files[selected_index]
         
+        self._read_metadata_async(file_path, lambda metadata, error: self._show_metadata_viewer(file_path, metadata, error))
+
+    def _show_metadata_viewer(self, file_path: str, metadata: Optional[Dict[str, str]], error: Optional[Exception]):
+        """Opens the viewer window once load_metadata's read has finished."""
         try:
-            editor = ComicMetadataEditor(file_path)
-            metadata = editor.read_metadata()
+            if error is not None:
+                raise error
             
             if not metadata:
                 messagebox.showwarning(
@@ -1191,6 +1634,8 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
 
     def copy_all_to_main_fields(self):
         """Copies metadata from the selected file into the main input fields."""
+        if self._read_in_progress:
+            return
         selected_indices = self.file_listbox.curselection()
         
         if len(selected_indices) != 1:
@@ -1201,10 +1646,14 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         selected_index = selected_indices[0]
         file_path = self.files[selected_index]
         self.update_status(f"Importing metadata from: {os.path.basename(file_path)}...")
+        
+        self._read_metadata_async(file_path, lambda metadata, error: self._import_metadata(file_path, metadata, error))
 
+    def _import_metadata(self, file_path: str, metadata: Optional[Dict[str, str]], error: Optional[Exception]):
+        """Fills the main input fields once copy_all_to_main_fields' read has finished."""
         try:
-            editor = ComicMetadataEditor(file_path)
-            metadata = editor.read_metadata()
+            if error is not None:
+                raise error
             
             if not metadata:
                  messagebox.showwarning(
@@ -1217,23 +1666,21 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
             
             updated_count = 0
             for key, value in metadata.items():
-                if key in self.control_vars:
+                if key in self.text_widgets:
+                    # Handle Text widget (cleared above, so a plain insert replaces its content)
+                    self.text_widgets[key].insert("1.0", value)
+                    
+                elif key in self.control_vars:
                     var = self.control_vars[key]
                     
                     if isinstance(var, tk.StringVar):
-                        # Handle Text widget
-                        if hasattr(var, 'widget_ref'):
-                            var.widget_ref.delete("1.0", tk.END)
-                            var.widget_ref.insert("1.0", value)
-                            var.set(value)
+                        # For Language, try to match ISO code ('en') to the full Combobox string ('en (English)')
+                        if key == 'language':
+                            iso_code = value.lower()
+                            matched_val = self.ISO_LANGUAGE_LOOKUP.get(iso_code, value)
+                            var.set(matched_val)
                         else:
-                            # For Language, try to match ISO code ('en') to the full Combobox string ('en (English)')
-                            if key == 'language':
-                                iso_code = value.lower()
-                                matched_val = next((s for s in self.ISO_LANGUAGES if s.startswith(iso_code + ' ')), value)
-                                var.set(matched_val)
-                            else:
-                                var.set(value)
+                            var.set(value)
                                 
                     elif isinstance(var, tk.IntVar):
                         # Handle Boolean values: 'Yes', 'No', 'True', 'False', 0, 1
@@ -1243,11 +1690,11 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
                         else:
                             var.set(0)
                             
-                    # Set the corresponding 'apply' checkbox to Ticked (1)
-                    check_key = f'check_{key}'
-                    if check_key in self.control_vars:
-                        self.control_vars[check_key].set(1)
-                        updated_count += 1
+                # Set the corresponding 'apply' checkbox to Ticked (1)
+                check_key = f'check_{key}'
+                if check_key in self.control_vars:
+                    self.control_vars[check_key].set(1)
+                    updated_count += 1
                         
             self.update_status(f"Successfully imported {updated_count} fields and ticked checkboxes.")
 
@@ -1257,6 +1704,9 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
 
     def apply_metadata(self):
         """Applies the current metadata values to all selected files."""
+        if self._apply_in_progress:
+            return
+
         selected_indices = list(self.file_listbox.curselection())
         
         if not selected_indices:
@@ -1267,8 +1717,11 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         gui_metadata_updates = self.get_metadata_values()
         
         # Check for autovoluming case: if 'volume' and 'volume_count' are checked
-        volume_check = self.control_vars.get('check_volume', tk.IntVar()).get()
-        volume_count_check = self.control_vars.get('check_volume_count', tk.IntVar()).get()
+        # No throwaway tk.IntVar() as a lookup default: each one registers a new Tcl variable
+        volume_check_var = self.control_vars.get('check_volume')
+        volume_count_check_var = self.control_vars.get('check_volume_count')
+        volume_check = volume_check_var.get() if volume_check_var is not None else 0
+        volume_count_check = volume_count_check_var.get() if volume_count_check_var is not None else 0
         
         # Check if the autovoluming condition is met
         autovolume_mode = False
@@ -1303,14 +1756,13 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         if not result:
             return
         
+        self._apply_in_progress = True
         self.file_listbox.config(state=tk.DISABLED)
         self.btn_apply.config(state=tk.DISABLED)
         self.progress_bar.config(mode='determinate', maximum=len(selected_indices))
         self.progress_bar.pack(fill=tk.X, pady=(0, 5))
-        
-        success_count = 0
-        error_count = 0
-        errors = []
+        self.btn_cancel.config(state=tk.NORMAL)
+        self.btn_cancel.pack(fill=tk.X, pady=(0, 5))
         
         current_num = start_num if autovolume_mode else 1 # Start sequential numbering at 1, unless autovolume is active
 
@@ -1325,82 +1777,216 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
         # Total count for the %c% placeholder
         total_count_str = str(len(selected_indices))
         
+        # Whether any file gets values of its own (volume number or %n%/%c% placeholders)
+        has_per_file_values = autovolume_mode or bool(string_fields_to_format)
+
+        # Archive rewriting is zlib + disk I/O (both release the GIL), so files are processed on a
+        # thread pool. Workers never touch Tk: results go through a queue that the main loop drains.
+        results = queue.Queue()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        futures = [] # Kept so cancel_apply can cancel the files that haven't started yet
+        
+        # A CBR is converted by removing and recreating its .cbz twin. Running that in parallel with a job
+        # that writes the same path (the twin itself, or another CBR with the same target) would let one
+        # worker clobber the other's output, so those conversions fail up front instead.
+        selected_paths = {os.path.normcase(os.path.abspath(self.files[i])) for i in selected_indices}
+        claimed_targets = set()
+        colliding_cbrs = set()
+        for list_index in selected_indices:
+            file_path = self.files[list_index]
+            if not file_path.lower().endswith('.cbr'):
+                continue
+            target = os.path.normcase(os.path.abspath(ComicMetadataEditor.cbz_path_for(file_path)))
+            if target in selected_paths or target in claimed_targets:
+                colliding_cbrs.add(list_index)
+            claimed_targets.add(target)
+        
         # Iterate over the selected indices in the display order
         for i, list_index in enumerate(selected_indices):
             file_path = self.files[list_index] # Get the file path from the underlying list
             
-            # The sequential number for this file (starts at 1)
-            file_sequence_num = i + 1
+            # The sequential number for this file (starts at 1), formatted once for all placeholder fields
+            file_sequence_str = str(i + 1)
+
+            # 1. Add all fixed (non-sequential) updates. Without per-file values every file shares
+            #    the same dict (workers only read it), so it is only copied when it gets modified below
+            file_updates = dict(gui_metadata_updates) if has_per_file_values else gui_metadata_updates
             
-            self.update_status(f"Processing file {file_sequence_num}/{total_count_str}: {os.path.basename(file_path)}")
-            self.root.update_idletasks()
+            # 2. Apply sequential volume number if in autovolume mode
+            if autovolume_mode:
+                file_updates['volume'] = str(current_num)
+                current_num += 1
+
+            # 3. Apply string formatting to relevant fields
+            for key, template_value in string_fields_to_format.items():
+                # NOTE: The %n% number here is (i+1) which is the file's index in the *selected list* + 1.
+                # If Autovolume is active, the 'volume' field uses its own sequence (current_num).
+                # This lets the user apply a completely separate number sequence from volume, or the same one.
+                formatted_value = template_value.replace('%n%', file_sequence_str)
+                formatted_value = formatted_value.replace('%c%', total_count_str)
+                
+                if formatted_value != template_value:
+                    file_updates[key] = formatted_value
+
+            # The target of a colliding CBR conversion is written by another job of this batch
+            if list_index in colliding_cbrs:
+                future = concurrent.futures.Future()
+                future.set_exception(FileExistsError(
+                    f"{os.path.basename(ComicMetadataEditor.cbz_path_for(file_path))} is also part of this batch; "
+                    "apply to the CBR separately"
+                ))
+                results.put((list_index, file_path, future))
+                continue
+
+            # 4. Files whose cached metadata (still valid for their mtime/size) already holds every update
+            #    are reported as unchanged right away, without opening the archive again
+            if file_path in self._metadata_cache:
+                try:
+                    cached = self._cached_metadata(file_path, self._file_signature(file_path))
+                except OSError:
+                    cached = None
+                if cached is not None and all(cached.get(k) == v for k, v in file_updates.items()):
+                    future = concurrent.futures.Future()
+                    future.set_result((file_path, True, cached))
+                    results.put((list_index, file_path, future))
+                    continue
+
+            # 5. Read, merge and write on a worker thread
+            future = executor.submit(self._apply_to_file, file_path, file_updates)
+            future.add_done_callback(lambda f, idx=list_index, path=file_path: results.put((idx, path, f)))
+            futures.append(future)
+        
+        executor.shutdown(wait=False)
+
+        state = {
+            'results': results, 'selected_indices': selected_indices, 'done': 0, 'futures': futures,
+            'success_count': 0, 'unchanged_count': 0, 'cancelled_count': 0, 'error_count': 0, 'errors': [], 'renamed': []
+        }
+        self._apply_state = state
+        self.root.after(50, self._poll_apply_results, state)
+
+    def cancel_apply(self):
+        """Cancels the files of the running bulk apply that no worker has started yet."""
+        state = self._apply_state
+        if state is None:
+            return
+        
+        # Running writes can't be interrupted safely; cancelled futures still arrive in the result queue
+        for future in state['futures']:
+            future.cancel()
+        self.btn_cancel.config(state=tk.DISABLED)
+        self.update_status("Cancelling... waiting for the files that are already being written.")
+
+    @staticmethod
+    def _apply_to_file(file_path: str, file_updates: Dict[str, str]) -> Tuple[Optional[str], bool, Optional[Dict[str, str]]]:
+        """Merges the updates into one file's metadata and writes it, returning (new path, unchanged, resulting metadata). Runs on a worker thread."""
+        editor = ComicMetadataEditor(file_path)
+        
+        # Merge: Start with existing data (for preservation), then overwrite/add only the new, checked values.
+        # Merging inside write_metadata reads and writes the archive through one open file.
+        new_path = editor.write_metadata(file_updates, merge=True)
+        return new_path, editor.unchanged, editor.result_metadata
+
+    def _poll_apply_results(self, state):
+        """Drains finished files from the worker queue and updates the progress on the Tk thread."""
+        results = state['results']
+        total = len(state['selected_indices'])
+        last_path = None
+        
+        while True:
+            try:
+                list_index, file_path, future = results.get_nowait()
+            except queue.Empty:
+                break
+            
+            state['done'] += 1
+            # The file was (possibly) rewritten; don't trust a cached parse even if its mtime didn't tick
+            self._metadata_cache.pop(file_path, None)
+            last_path = file_path
+            if future.cancelled():
+                state['cancelled_count'] += 1
+                continue
             
+            error = None
             try:
-                editor = ComicMetadataEditor(file_path)
-                
-                # 1. Read existing metadata (for preservation)
-                existing_metadata = editor.read_metadata()
-                
-                # 2. Merge: Start with existing data, then overwrite/add only the new, checked values
-                merged_metadata = existing_metadata.copy()
-                merged_metadata.update(gui_metadata_updates) # Add all fixed (non-sequential) updates
-                
-                # 3. Apply sequential volume number if in autovolume mode
-                if autovolume_mode:
-                    merged_metadata['volume'] = str(current_num)
-                    current_num += 1
-
-                # 4. Apply string formatting to relevant fields
-                for key, template_value in string_fields_to_format.items():
-                    # If autovolume is NOT active, we use the simple sequence number (i+1) for %n%
-                    # If autovolume IS active, %n% is implicitly the same as the autovolume sequence (current_num - 1, since it's incremented already) 
-                    # For simplicity, we use the file_sequence_num (i+1) for the %n% placeholder replacement.
-                    # This lets the user apply a completely separate number sequence from volume, or the same one.
-                    
-                    # NOTE: The %n% number here is (i+1) which is the file's index in the *selected list* + 1.
-                    # If Autovolume is active, the 'volume' field uses its own sequence (current_num).
-                    
-                    formatted_value = template_value.replace('%n%', str(file_sequence_num))
-                    formatted_value = formatted_value.replace('%c%', total_count_str)
-                    
-                    if formatted_value != template_value:
-                        merged_metadata[key] = formatted_value
-                    
-                # 5. Write the merged result
-                new_path_str = editor.write_metadata(merged_metadata)
-                
-                if new_path_str:
-                    success_count += 1
+                new_path_str, unchanged, result_metadata = future.result()
+                if new_path_str and result_metadata is not None:
+                    # Remember what the file now holds, so a repeated apply can skip it without opening it
+                    try:
+                        self._cache_metadata(new_path_str, self._file_signature(new_path_str), result_metadata)
+                    except OSError:
+                        pass
+                if unchanged:
+                    # Already up to date, write_metadata skipped the rewrite
+                    state['unchanged_count'] += 1
+                elif new_path_str:
+                    state['success_count'] += 1
                     if new_path_str != file_path:
                         # File type changed (CBR -> CBZ), update the list
                         self.files[list_index] = new_path_str
+                        state['renamed'].append(list_index)
                 else:
-                    error_count += 1
-                    errors.append(f"{os.path.basename(file_path)}: Write failed")
+                    error = "Write failed"
             except Exception as e:
-                error_count += 1
-                errors.append(f"{os.path.basename(file_path)}: {str(e)}")
+                error = e
             
-            self.progress_bar['value'] = i + 1
-            self.root.update_idletasks()
+            if error is not None:
+                state['error_count'] += 1
+                # Only the first few errors are shown in the summary, so only those are kept (and formatted later)
+                if len(state['errors']) < self.MAX_REPORTED_ERRORS:
+                    state['errors'].append((file_path, error))
+        
+        # One status/progress redraw per tick (at most 20 per second), however many files finished in between
+        if last_path is not None:
+            self.update_status(f"Processed file {state['done']}/{total}: {os.path.basename(last_path)}")
+            self.progress_bar['value'] = state['done']
+        
+        if state['done'] < total:
+            self.root.after(50, self._poll_apply_results, state)
+            return
         
+        # One directory sync for the whole batch makes the renames durable
+        ComicMetadataEditor.sync_directories([self.files[i] for i in state['selected_indices']])
+        
+        self._apply_in_progress = False
         self.file_listbox.config(state=tk.NORMAL)
-        self._update_listbox_display(selected_indices) # Refresh display and re-select
+        # Only converted files changed their name, so only their rows are replaced instead of rebuilding the list
+        for list_index in state['renamed']:
+            self.file_listbox.delete(list_index)
+            self.file_listbox.insert(list_index, os.path.basename(self.files[list_index]))
+        # Re-select (replaced rows lose their selection, and exportselection may have cleared it meanwhile)
+        self.file_listbox.selection_clear(0, tk.END)
+        for first, last in self._index_runs(state['selected_indices']):
+            self.file_listbox.select_set(first, last)
         
         self.btn_apply.config(state=tk.NORMAL)
         self.progress_bar.pack_forget() 
         self.progress_bar['value'] = 0
+        self.btn_cancel.pack_forget()
+        self._apply_state = None
+        
+        success_count = state['success_count']
+        error_count = state['error_count']
+        errors = state['errors']
+        cancelled_count = state['cancelled_count']
         
-        msg = f"Successfully updated: {success_count}\nFailed: {error_count}"
+        msg = f"Successfully updated: {success_count}\nUnchanged: {state['unchanged_count']}\nFailed: {error_count}"
+        if cancelled_count:
+            msg += f"\nCancelled (not touched): {cancelled_count}"
         if errors:
-            msg += "\n\nErrors:\n" + "\n".join(errors[:5])
-            if len(errors) > 5:
-                msg += f"\n... and {len(errors) - 5} more"
+            msg += "\n\nErrors:\n" + "\n".join(f"{os.path.basename(path)}: {error}" for path, error in errors)
+            if error_count > len(errors):
+                msg += f"\n... and {error_count - len(errors)} more"
         
         if error_count == 0:
             if WINSOUND_AVAILABLE: winsound.MessageBeep(winsound.MB_ICONASTERISK)
-            messagebox.showinfo("Success", msg)
+            # Nothing to read through on success, so no modal dialog blocks the next batch
+            toast = f"✔ Done. Updated: {success_count} | Unchanged: {state['unchanged_count']}"
+            if cancelled_count:
+                toast = f"Cancelled. Updated: {success_count} | Unchanged: {state['unchanged_count']} | Not touched: {cancelled_count}"
+            self._show_toast(toast)
         else:
+            # Failures keep the dialog, the error list needs to stay up until it has been read
             if WINSOUND_AVAILABLE: winsound.MessageBeep(winsound.MB_ICONWARNING)
             messagebox.showwarning("Completed with Errors", msg)
         
@@ -1408,18 +1994,16 @@ This version re-integrates the **Autovoluming** and **Manual Sorting** tools alo
 
     def on_file_select(self, event):
         """Handle selection changes in the file listbox."""
-        selected_indices = self.file_listbox.curselection()
-        
-        is_single_selection = len(selected_indices) == 1
-        
-        # Update 'View Metadata' button state based on selection count
-        if self.view_metadata_btn:
-            self.view_metadata_btn.config(state=tk.NORMAL if is_single_selection else tk.DISABLED)
-        
-        # Update 'Import Metadata' button state based on selection count
-        if self.copy_all_btn:
-            self.copy_all_btn.config(state=tk.NORMAL if is_single_selection else tk.DISABLED)
-            
+        # Drag/shift selections fire <<ListboxSelect>> for every row crossed; coalesce them into one refresh
+        if self._select_refresh_pending:
+            return
+        self._select_refresh_pending = True
+        self.root.after(50, self._refresh_after_select)
+
+    def _refresh_after_select(self):
+        """Runs the coalesced status refresh for on_file_select."""
+        self._select_refresh_pending = False
+        # update_status reads the selection once and sets the Apply/View/Import button states from it
         self.update_status()
 
 
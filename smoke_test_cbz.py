@@ -0,0 +1,178 @@
+"""Smoke test for the CBZ write paths of comic-editor-python-gui.py (no GUI is started).
+
+Run with: python smoke_test_cbz.py
+Covers the in-place patch (stored and deflated XML, including the deflate padding) and the full
+rebuild, whose raw member copy has to handle data descriptors and ZIP64 entries. Both paths must keep
+the page bytes, their compression and the archive comment.
+"""
+import os
+import io
+import sys
+import random
+import struct
+import shutil
+import zipfile
+import zlib
+import tempfile
+import importlib.util
+
+# The module name has dashes, so it is loaded from its path
+MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'comic-editor-python-gui.py')
+spec = importlib.util.spec_from_file_location('comic_editor', MODULE_PATH)
+comic_editor = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(comic_editor)
+Editor = comic_editor.ComicMetadataEditor
+
+COMMENT = b'{"ComicBookInfo/1.0": {"title": "Smoke"}}'
+
+rnd = random.Random(1)
+# A long, barely compressible old title leaves room for short new XML in its slot
+OLD_XML = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    f'<ComicInfo><Title>{rnd.getrandbits(1600):x}</Title><Series>S</Series></ComicInfo>'
+)
+PAGES = {f'p{i:03}.jpg': bytes(rnd.getrandbits(8) for _ in range(5000)) for i in range(4)}
+
+
+class NonSeekable(io.RawIOBase):
+    """Write-only stream without tell/seek, which makes zipfile write data descriptors."""
+    def __init__(self, target):
+        self.target = target
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.target.write(data)
+
+
+def page_compression(name: str) -> int:
+    return zipfile.ZIP_DEFLATED if int(name[1:4]) % 2 else zipfile.ZIP_STORED
+
+
+def build_cbz(path: str, xml_first: bool = False, xml_compression: int = zipfile.ZIP_DEFLATED,
+              descriptors: bool = False, zip64: bool = False):
+    """Writes a test CBZ with alternating stored/deflated pages and a ComicInfo.xml."""
+    with open(path, 'wb') as raw:
+        with zipfile.ZipFile(NonSeekable(raw) if descriptors else raw, 'w') as zf:
+            zf.comment = COMMENT
+            if xml_first:
+                zf.writestr('ComicInfo.xml', OLD_XML, compress_type=xml_compression)
+            for name, data in PAGES.items():
+                info = zipfile.ZipInfo(name, date_time=(2020, 1, 1, 0, 0, 0))
+                info.compress_type = page_compression(name)
+                with zf.open(info, 'w', force_zip64=zip64) as member:
+                    member.write(data)
+            if not xml_first:
+                zf.writestr('ComicInfo.xml', OLD_XML, compress_type=xml_compression)
+
+
+def check_layout(raw, zf: zipfile.ZipFile):
+    """Asserts every entry ends exactly where the next one (or the central directory) starts."""
+    infos = sorted(zf.infolist(), key=lambda i: i.header_offset)
+    ends = [i.header_offset for i in infos[1:]] + [zf.start_dir]
+    for info, end in zip(infos, ends):
+        raw.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack('<HH', raw.read(4))
+        data_end = info.header_offset + 30 + name_len + extra_len + info.compress_size
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            # The deflate stream has to end exactly at the end of the data (the in-place patch pads it)
+            raw.seek(data_end - info.compress_size)
+            inflater = zlib.decompressobj(-15)
+            inflater.decompress(raw.read(info.compress_size))
+            assert inflater.eof and not inflater.unused_data, info.filename
+        if info.flag_bits & 0x08:
+            # Signature, CRC and the sizes (8 bytes each for ZIP64) follow the data
+            raw.seek(data_end)
+            descriptor = raw.read(end - data_end)
+            assert len(descriptor) in (16, 24) and descriptor[:4] == b'PK\x07\x08', info.filename
+            assert struct.unpack('<I', descriptor[4:8])[0] == info.CRC, info.filename
+        else:
+            assert data_end == end, info.filename
+
+
+def check_cbz(path: str, expected: dict):
+    """Asserts the archive is intact and holds exactly the expected metadata."""
+    with open(path, 'rb') as raw, zipfile.ZipFile(raw) as zf:
+        assert zf.testzip() is None
+        check_layout(raw, zf)
+        assert zf.comment == COMMENT, zf.comment
+        names = zf.namelist()
+        assert names.count('ComicInfo.xml') == 1, names
+        for name, data in PAGES.items():
+            assert zf.read(name) == data, name
+            assert zf.getinfo(name).compress_type == page_compression(name), name
+    metadata = Editor(path).read_metadata()
+    assert metadata == expected, metadata
+
+
+def write(path: str, title: str):
+    """Writes a new title and returns which path write_metadata took."""
+    calls = []
+    editor = Editor(path)
+    for method in ('_try_inplace_update', '_rewrite_cbz'):
+        original = getattr(editor, method)
+        def spy(*args, _name=method, _original=original):
+            result = _original(*args)
+            calls.append((_name, result))
+            return result
+        setattr(editor, method, spy)
+
+    inode = os.stat(path).st_ino
+    assert editor.write_metadata({'title': title}, merge=True) == path
+    check_cbz(path, {'title': title, 'series': 'S'})
+    assert not editor.unchanged
+    assert editor.result_metadata == {'title': title, 'series': 'S'}, editor.result_metadata
+
+    if ('_try_inplace_update', True) in calls:
+        taken = 'inplace'
+    else:
+        assert ('_rewrite_cbz', None) in calls, calls
+        taken = 'rebuild'
+    # Only the rebuild swaps in a new file
+    assert (os.stat(path).st_ino == inode) == (taken != 'rebuild'), taken
+    return taken
+
+
+def main():
+    print('lxml', comic_editor.LXML_AVAILABLE)
+    work_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(work_dir, 'test.cbz')
+        long_title = f'{random.Random(2).getrandbits(8000):x}' # Too much for the old XML's slot
+
+        # Deflated and stored XML slots are patched in place while the new XML fits
+        for xml_compression in (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED):
+            build_cbz(path, xml_first=True, xml_compression=xml_compression)
+            assert write(path, 'New') == 'inplace'
+            assert write(path, 'x') == 'inplace'
+            # Too big for the slot: full rebuild through a temporary archive
+            assert write(path, long_title) == 'rebuild'
+            # The rebuilt XML entry is patched in place again
+            assert write(path, 'y') == 'inplace'
+
+        # The raw member copy of a rebuild keeps data descriptor and ZIP64 entries readable
+        for options in ({'descriptors': True}, {'zip64': True}, {'descriptors': True, 'zip64': True}):
+            build_cbz(path, xml_first=True, **options)
+            with open(path, 'rb') as raw, zipfile.ZipFile(raw) as zf:
+                page = zf.getinfo('p000.jpg')
+                assert bool(page.flag_bits & 0x08) == options.get('descriptors', False), options
+                # force_zip64 only puts the ZIP64 extra field into the local header
+                raw.seek(page.header_offset + 28)
+                assert (struct.unpack('<H', raw.read(2))[0] > 0) == options.get('zip64', False), options
+            assert write(path, long_title) == 'rebuild', options
+
+        # Writing the same values again leaves the file alone
+        editor = Editor(path)
+        mtime = os.stat(path).st_mtime_ns
+        assert editor.write_metadata({'title': long_title}, merge=True) == path
+        assert editor.unchanged and os.stat(path).st_mtime_ns == mtime
+
+        assert os.listdir(work_dir) == ['test.cbz'], os.listdir(work_dir) # No temporary archives left behind
+    finally:
+        shutil.rmtree(work_dir)
+    print('OK')
+
+
+if __name__ == '__main__':
+    sys.exit(main())